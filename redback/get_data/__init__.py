@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
-import urllib
 
 import pandas as pd
 
@@ -253,10 +253,34 @@ def get_open_transient_catalog_data(
     return getter.get_data()
 
 
+def get_many(
+        transients: list, transient_type: str, max_workers: int = 8, **kwargs: None) -> list:
+    """Gets data for several transients from the Open Access Catalog concurrently.
+    The downloads are network bound, so they are spread over a pool of threads sharing one connection pool.
+
+    :param transients: The names of the transients, e.g. ['at2017gfo', 'SN2011kl'].
+    :type transients: list
+    :param transient_type: Type of the transients. Must be from
+                           `redback.get_data.open_data.OpenDataGetter.VALID_TRANSIENT_TYPES`.
+    :type transient_type: str
+    :param max_workers: Maximum number of simultaneous downloads. (Default value = 8)
+    :type max_workers: int
+    :param kwargs: Placeholder to prevent TypeErrors.
+    :type kwargs: None
+
+    :return: The processed data for each transient, in the order of `transients`.
+    :rtype: list
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda transient: get_open_transient_catalog_data(transient, transient_type=transient_type),
+            transients))
+
+
 def get_oac_metadata() -> None:
     """Retrieves Open Access Catalog metadata table."""
     url = 'https://api.astrocats.space/catalog?format=CSV'
-    urllib.request.urlretrieve(url, 'metadata.csv')
+    utils.download_file(url=url, filename='metadata.csv')
     logger.info('Downloaded metadata for open access catalog transients.')
 
 
@@ -1,6 +1,4 @@
 import os
-import urllib
-import urllib.request
 
 import astropy.io.fits.hdu
 import numpy as np
@@ -9,7 +7,7 @@ from astropy.io import fits
 
 import redback
 from redback.get_data.getter import GRBDataGetter
-from redback.get_data.utils import get_batse_trigger_from_grb
+from redback.get_data.utils import download_file, get_batse_trigger_from_grb
 
 _dirname = os.path.dirname(__file__)
 
@@ -83,7 +81,7 @@ class BATSEDataGetter(GRBDataGetter):
 
     def collect_data(self) -> None:
         """Downloads the data from HEASARC and saves it into the raw file path."""
-        urllib.request.urlretrieve(self.url, self.raw_file_path)
+        download_file(url=self.url, filename=self.raw_file_path)
 
     def convert_raw_data_to_csv(self) -> pd.DataFrame:
         """Converts the raw data into processed data and saves it into the processed file path.
@@ -1,11 +1,9 @@
 import os
 from typing import Union
 
-import astropy.units as uu
 import numpy as np
 import pandas as pd
 import requests
-from astropy.time import Time
 
 import redback
 import redback.get_data.directory
@@ -105,10 +103,7 @@ class LasairDataGetter(DataGetter):
         processed_data = processed_data.sort_values(by="time")
 
         time_of_event = min(processed_data["time"]) - 0.1
-        time_of_event = Time(time_of_event, format='mjd')
-
-        tt = Time(np.asarray(processed_data["time"], dtype=float), format='mjd')
-        processed_data['time (days)'] = ((tt - time_of_event).to(uu.day)).value
+        processed_data['time (days)'] = np.asarray(processed_data["time"], dtype=float) - time_of_event
         processed_data.to_csv(self.processed_file_path, sep=',', index=False)
         logger.info(f'Congratulations, you now have a nice data file: {self.processed_file_path}')
         return processed_data
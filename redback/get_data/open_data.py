@@ -2,14 +2,9 @@ import os
 import re
 import sqlite3
 from typing import Union
-import urllib
-import urllib.request
-import ssl
 
-import astropy.units as uu
 import numpy as np
 import pandas as pd
-import requests
 from astropy.time import Time
 
 import redback
@@ -75,13 +70,13 @@ class OpenDataGetter(DataGetter):
             logger.warning('The raw data file already exists.')
             return None
 
-        if 'not found' in requests.get(self.url).text:
+        if 'not found' in redback.get_data.utils.session.get(self.url, timeout=30).text:
             raise ValueError(
                 f"Transient {self.transient} does not exist in the catalog. "
                 f"Are you sure you are using the right alias?")
-        urllib.request.urlretrieve(url=self.url, filename=self.raw_file_path)
+        redback.get_data.utils.download_file(url=self.url, filename=self.raw_file_path)
         logger.info(f"Retrieved data for {self.transient}.")
-        urllib.request.urlretrieve(url=self.metadata_url, filename=self.metadata_path)
+        redback.get_data.utils.download_file(url=self.metadata_url, filename=self.metadata_path)
         logger.info(f"Metadata for {self.transient} added.")
 
 
@@ -102,26 +97,23 @@ class OpenDataGetter(DataGetter):
             raw_data['system'].fillna('AB', inplace=True)
         logger.info('Processing data for transient {}.'.format(self.transient))
 
-        data = raw_data.copy()
-        data = data[data['band'] != 'C']
-        data = data[data['band'] != 'W']
-        data = data[data['system'] == 'AB']
+        data = raw_data[~raw_data['band'].isin(['C', 'W']) & (raw_data['system'] == 'AB')].copy()
         logger.info('Keeping only AB magnitude data')
-        data['flux_density(mjy)'] = calc_flux_density_from_ABmag(data['magnitude'].values).value
+        magnitude = data['magnitude'].to_numpy(dtype=np.float64)
+        magnitude_error = data['e_magnitude'].to_numpy(dtype=np.float64)
+        bands = data['band'].values
+        data['flux_density(mjy)'] = calc_flux_density_from_ABmag(magnitude).value
         data['flux_density_error'] = calc_flux_density_error_from_monochromatic_magnitude(
-            magnitude=data['magnitude'].values, magnitude_error=data['e_magnitude'].values, reference_flux=3631,
-            magnitude_system='AB')
-        data['flux(erg/cm2/s)'] = bandpass_magnitude_to_flux(data['magnitude'].values, data['band'].values)
-        data['flux_error'] = calc_flux_error_from_magnitude(magnitude=data['magnitude'].values,
-                                        magnitude_error=data['e_magnitude'].values,
-                                        reference_flux=bands_to_reference_flux(data['band'].values))
+            magnitude=magnitude, magnitude_error=magnitude_error, reference_flux=3631, magnitude_system='AB')
+        data['flux(erg/cm2/s)'] = bandpass_magnitude_to_flux(magnitude, bands)
+        data['flux_error'] = calc_flux_error_from_magnitude(magnitude=magnitude, magnitude_error=magnitude_error,
+                                                            reference_flux=bands_to_reference_flux(bands))
         data['band'] = [b.replace("'", "") for b in data["band"]]
         metadata = pd.read_csv(f"{self.directory_path}{self.transient}_metadata.csv")
         metadata.replace(r'^\s+$', np.nan, regex=True)
         time_of_event = self.get_time_of_event(data=data, metadata=metadata)
 
-        tt = Time(np.asarray(data['time'], dtype=float), format='mjd')
-        data['time (days)'] = ((tt - time_of_event).to(uu.day)).value
+        data['time (days)'] = np.asarray(data['time'], dtype=float) - time_of_event.mjd
         data.to_csv(self.processed_file_path, sep=',', index=False)
         logger.info(f'Congratulations, you now have a nice data file: {self.processed_file_path}')
         return data
@@ -1,21 +1,22 @@
 from __future__ import annotations
 
+import io
 import os
-import time
 from typing import Union
-import urllib
-import urllib.request
 
 import astropy.io.ascii
 import numpy as np
 import pandas as pd
-import requests
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
 
 import redback.get_data.directory
 import redback.get_data.utils
 import redback.redback_errors
 from redback.get_data.getter import GRBDataGetter
-from redback.utils import fetch_driver, check_element
+from redback.utils import fetch_shared_driver, reset_shared_driver, check_element
 from redback.utils import logger
 
 dirname = os.path.dirname(__file__)
@@ -39,6 +40,7 @@ class SwiftDataGetter(GRBDataGetter):
                         "flux_100_350 [counts/s/det]", "flux_100_350_err [counts/s/det]", "flux_15_350 [counts/s/det]",
                         "flux_15_350_err [counts/s/det]"]
     SWIFT_PROMPT_BIN_SIZES = ['1s', '2ms', '8ms', '16ms', '64ms', '256ms']
+    WEBDRIVER_TIMEOUT = 30
 
     def __init__(
             self, grb: str, transient_type: str, data_mode: str,
@@ -178,7 +180,7 @@ class SwiftDataGetter(GRBDataGetter):
             logger.warning('The raw data file already exists. Returning.')
             return
 
-        response = requests.get(self.grb_website)
+        response = redback.get_data.utils.session.get(self.grb_website, timeout=30)
         if 'No Light curve available' in response.text:
             raise redback.redback_errors.WebsiteExist(
                 f'Problem loading the website for GRB{self.stripped_grb}. '
@@ -194,36 +196,44 @@ class SwiftDataGetter(GRBDataGetter):
     def download_flux_density_data(self) -> None:
         """Downloads flux density data from the Swift website.
         Uses the PhantomJS headless browser to click through the website.
-        Properly quits the driver.
+        The driver is shared between downloads, its cookies are cleared afterwards.
         """
-        driver = fetch_driver()
+        driver = fetch_shared_driver()
         try:
+            wait = WebDriverWait(driver, self.WEBDRIVER_TIMEOUT)
             driver.get(self.grb_website)
-            driver.find_element_by_xpath("//select[@name='xrtsub']/option[text()='no']").click()
-            time.sleep(20)
-            driver.find_element_by_id("xrt_DENSITY_makeDownload").click()
-            time.sleep(20)
+            # compare against the loaded url, the site may have redirected the requested one
+            start_url = driver.current_url
+            wait.until(expected_conditions.element_to_be_clickable(
+                (By.XPATH, "//select[@name='xrtsub']/option[text()='no']"))).click()
+            wait.until(expected_conditions.element_to_be_clickable((By.ID, "xrt_DENSITY_makeDownload"))).click()
+            wait.until(lambda d: d.current_url != start_url)
             grb_url = driver.current_url
             # scrape the data
-            urllib.request.urlretrieve(url=grb_url, filename=self.raw_file_path)
+            redback.get_data.utils.download_file(url=grb_url, filename=self.raw_file_path)
             logger.info(f'Congratulations, you now have raw data for {self.grb}')
         except Exception as e:
             logger.warning(f'Cannot load the website for {self.grb} \n'
                            f'Failed with exception: \n'
                            f'{e}')
+            if isinstance(e, WebDriverException):
+                # the driver may be dead, start a fresh one for the next download
+                reset_shared_driver()
+                driver = None
         finally:
-            # Close the driver and all opened windows
-            driver.quit()
-            urllib.request.urlcleanup()
+            self._clear_shared_driver(driver)
 
     def download_integrated_flux_data(self) -> None:
         """Downloads integrated flux density data from the Swift website.
         Uses the PhantomJS headless browser to click through the website.
-        Properly quits the driver.
+        The driver is shared between downloads, its cookies are cleared afterwards.
         """
-        driver = fetch_driver()
+        driver = fetch_shared_driver()
         try:
+            wait = WebDriverWait(driver, self.WEBDRIVER_TIMEOUT)
             driver.get(self.grb_website)
+            # compare against the loaded url, the site may have redirected the requested one
+            start_url = driver.current_url
             # select option for BAT bin_size
             bat_binning = 'batxrtbin'
             if check_element(driver, bat_binning):
@@ -239,33 +249,44 @@ class SwiftDataGetter(GRBDataGetter):
                 driver.find_element_by_xpath(".//*[@id='batxrtband1']").click()
                 driver.find_element_by_xpath(".//*[@id='batxrtband0']").click()
             # Generate data file
-            driver.find_element_by_xpath(".//*[@id='batxrt_XRTBAND_makeDownload']").click()
-            time.sleep(20)
+            wait.until(expected_conditions.element_to_be_clickable(
+                (By.XPATH, ".//*[@id='batxrt_XRTBAND_makeDownload']"))).click()
+            wait.until(lambda d: d.current_url != start_url)
             grb_url = driver.current_url
-            driver.quit()
-            urllib.request.urlretrieve(grb_url, self.raw_file_path)
+            redback.get_data.utils.download_file(url=grb_url, filename=self.raw_file_path)
             logger.info(f'Congratulations, you now have raw data for {self.grb}')
         except Exception as e:
             logger.warning(f'Cannot load the website for {self.grb} \n'
                            f'Failed with exception: \n'
                            f'{e}')
+            if isinstance(e, WebDriverException):
+                # the driver may be dead, start a fresh one for the next download
+                reset_shared_driver()
+                driver = None
         finally:
-            # Close the driver and all opened windows
-            driver.quit()
-            urllib.request.urlcleanup()
+            self._clear_shared_driver(driver)
+
+    @staticmethod
+    def _clear_shared_driver(driver) -> None:
+        """Clears the cookies of the shared driver for the next download, resets the driver if that fails."""
+        if driver is None:
+            return
+        try:
+            driver.delete_all_cookies()
+        except WebDriverException as e:
+            logger.warning(f'Could not clear the webdriver cookies: {e}')
+            reset_shared_driver()
 
     def download_directly(self) -> None:
         """Downloads prompt or XRT data directly without using PhantomJS if possible."""
         try:
-            urllib.request.urlretrieve(self.grb_website, self.raw_file_path)
+            redback.get_data.utils.download_file(url=self.grb_website, filename=self.raw_file_path)
             logger.info(f'Congratulations, you now have raw {self.instrument} {self.transient_type} '
                         f'data for {self.grb}')
         except Exception as e:
             logger.warning(f'Cannot load the website for {self.grb} \n'
                            f'Failed with exception: \n'
                            f'{e}')
-        finally:
-            urllib.request.urlcleanup()
 
     def convert_raw_data_to_csv(self) -> Union[pd.DataFrame, None]:
         """Converts the raw data into processed data and saves it into the processed file path.
@@ -291,7 +312,11 @@ class SwiftDataGetter(GRBDataGetter):
         :return: The processed data.
         :rtype: pandas.DataFrame
         """
-        data = np.loadtxt(self.raw_file_path, comments=['!', 'READ', 'NO'])
+        with open(self.raw_file_path) as f:
+            skiprows = [i for i, line in enumerate(f) if line.lstrip().startswith(('!', 'READ', 'NO'))]
+        data = pd.read_csv(
+            self.raw_file_path, sep=r'\s+', comment='!', header=None, skiprows=skiprows, dtype=np.float64,
+            engine='c', float_precision='round_trip').to_numpy()
         data = {key: data[:, i] for i, key in enumerate(self.XRT_DATA_KEYS)}
         data = pd.DataFrame(data)
         data = data[data["Pos. flux err [erg cm^{-2} s^{-1}]"] != 0.]
@@ -316,7 +341,9 @@ class SwiftDataGetter(GRBDataGetter):
         :return: The processed data.
         :rtype: pandas.DataFrame
         """
-        data = np.loadtxt(self.raw_file_path)
+        data = pd.read_csv(
+            self.raw_file_path, sep=r'\s+', comment='#', header=None, dtype=np.float64, engine='c',
+            float_precision='round_trip').to_numpy()
         df = pd.DataFrame(data=data, columns=self.PROMPT_DATA_KEYS)
         df.to_csv(self.processed_file_path, index=False, sep=',')
         return df
@@ -328,22 +355,9 @@ class SwiftDataGetter(GRBDataGetter):
         :return: The processed data.
         :rtype: pandas.DataFrame
         """
-        data = {key: [] for key in self.INTEGRATED_FLUX_KEYS}
-        with open(self.raw_file_path) as f:
-            started = False
-            for num, line in enumerate(f.readlines()):
-                if line.startswith('NO NO NO'):
-                    started = True
-                if not started:
-                    continue
-                if line.startswith('!'):
-                    instrument = line[2:].replace('\n', '')
-                if line[0].isnumeric() or line[0] == '-':
-                    line_items = line.split('\t')
-                    data['Instrument'] = instrument
-                    for key, item in zip(self.INTEGRATED_FLUX_KEYS, line_items):
-                        data[key].append(item.replace('\n', ''))
-        df = pd.DataFrame(data=data)
+        df, instruments = self._read_burst_analyser_data(keys=self.INTEGRATED_FLUX_KEYS[:-1])
+        # All rows are labelled with the instrument of the last data block
+        df['Instrument'] = instruments.iloc[-1] if len(instruments) > 0 else None
         df.to_csv(self.processed_file_path, index=False, sep=',')
         return df
 
@@ -354,21 +368,34 @@ class SwiftDataGetter(GRBDataGetter):
         :return: The processed data.
         :rtype: pandas.DataFrame
         """
-        data = {key: [] for key in self.FLUX_DENSITY_KEYS}
-        with open(self.raw_file_path) as f:
-            started = False
-            for num, line in enumerate(f.readlines()):
-                if line.startswith('NO NO NO'):
-                    started = True
-                if not started:
-                    continue
-                if line[0].isnumeric() or line[0] == '-':
-                    line_items = line.split('\t')
-                    for key, item in zip(self.FLUX_DENSITY_KEYS, line_items):
-                        data[key].append(item.replace('\n', ''))
-        data['Flux [mJy]'] = [float(x) * 1000 for x in data['Flux [mJy]']]
-        data['Pos. flux err [mJy]'] = [float(x) * 1000 for x in data['Pos. flux err [mJy]']]
-        data['Neg. flux err [mJy]'] = [float(x) * 1000 for x in data['Neg. flux err [mJy]']]
-        df = pd.DataFrame(data=data)
+        df, _ = self._read_burst_analyser_data(keys=self.FLUX_DENSITY_KEYS)
+        for key in ['Flux [mJy]', 'Pos. flux err [mJy]', 'Neg. flux err [mJy]']:
+            df[key] = df[key].astype(float) * 1000
         df.to_csv(self.processed_file_path, index=False, sep=',')
         return df
+
+    def _read_burst_analyser_data(self, keys: list) -> tuple:
+        """Reads the data rows after the first 'NO NO NO' separator of the raw burst analyser file.
+        Each data block is preceded by a line of the form '! <instrument>'. Only these markers are scanned in
+        Python, the data rows themselves are parsed by the C engine of `pandas.read_csv`. Fields beyond `keys`,
+        e.g. from a trailing tab, are dropped.
+
+        :param keys: The column names of the data rows.
+        :type keys: list
+        :return: The data rows as strings and the instrument of each row.
+        :rtype: tuple
+        """
+        with open(self.raw_file_path) as f:
+            text = f.read()
+        lines = pd.Series(text.split('\n'), dtype=object)
+        started = lines.str.startswith('NO NO NO').cummax()
+        instruments = lines.str[2:].where(lines.str.startswith('!')).ffill()
+        first_character = lines.str[:1]
+        is_data = started & (first_character.str.isnumeric() | (first_character == '-'))
+        if not is_data.any():
+            return pd.DataFrame(columns=keys), pd.Series(dtype=object)
+        df = pd.read_csv(
+            io.StringIO(text), sep='\t', header=None, dtype=str, keep_default_na=False, skip_blank_lines=False,
+            skiprows=np.flatnonzero(~is_data.to_numpy()), usecols=range(len(keys)), engine='c')
+        df.columns = keys
+        return df, instruments[is_data].reset_index(drop=True)
@@ -1,11 +1,37 @@
+import functools
 import os
+
 import pandas as pd
 import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
 
 import astropy.io.ascii
 
 _dirname = os.path.dirname(__file__)
 
+# Shared session so that repeated requests to the same host reuse the open connection.
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3))
+session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3))
+
+
+def download_file(url: str, filename: str, chunk_size: int = 1 << 18) -> None:
+    """Streams the file at the given url into `filename` using the shared session.
+
+    :param url: The url of the file.
+    :type url: str
+    :param filename: The path to write the file to.
+    :type filename: str
+    :param chunk_size: Number of bytes read from the connection at a time. (Default value = 256 KiB)
+    :type chunk_size: int
+    """
+    with session.get(url, stream=True, timeout=60) as response:
+        response.raise_for_status()
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+
 
 def get_trigger_number(grb: str) -> str:
     """Gets the trigger number from the GRB table.
@@ -16,28 +42,46 @@ def get_trigger_number(grb: str) -> str:
     :rtype: str
     """
     grb = grb.lstrip('GRB')
-    grb_table = get_grb_table()
-    trigger = grb_table.query('GRB == @grb')['Trigger Number']
-    if len(trigger) == 0:
+    trigger = _get_trigger_numbers().get(grb)
+    if trigger is None:
         raise TriggerNotFoundError(f"The trigger for {grb} does not exist in the table.")
-    else:
-        return trigger.values[0]
+    return trigger
 
 
 def get_grb_table() -> pd.DataFrame:
     """
+    :return: The combined long and short GRB table.
+    :rtype: pandas.DataFrame
+    """
+    return _read_grb_table().copy()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_grb_table() -> pd.DataFrame:
+    """Reads the GRB tables from disk once per session. Use `get_grb_table` to get a modifiable copy.
+
     :return: The combined long and short GRB table.
     :rtype: pandas.DataFrame
     """
     short_table = os.path.join(_dirname, '../tables/SGRB_table.txt')
     long_table = os.path.join(_dirname, '../tables/LGRB_table.txt')
     sgrb = pd.read_csv(
-        short_table, header=0, on_bad_lines='skip', delimiter='\t', dtype='str')
+        short_table, header=0, on_bad_lines='skip', delimiter='\t', dtype='str', engine='c')
     lgrb = pd.read_csv(
-        long_table, header=0, on_bad_lines='skip', delimiter='\t', dtype='str')
+        long_table, header=0, on_bad_lines='skip', delimiter='\t', dtype='str', engine='c')
     return pd.concat([lgrb, sgrb], ignore_index=True)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_trigger_numbers() -> dict:
+    """
+    :return: Mapping of GRB names to trigger numbers. The first entry is kept for GRBs listed multiple times.
+    :rtype: dict
+    """
+    grb_table = _read_grb_table().drop_duplicates(subset='GRB')
+    return dict(zip(grb_table['GRB'], grb_table['Trigger Number']))
+
+
 def get_batse_trigger_from_grb(grb: str) -> int:
     """Gets the BATSE trigger from the BATSE trigger table. If the same trigger appears multiple times,
     successive alphabetical letters need to be appended to distinguish the triggers.
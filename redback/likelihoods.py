@@ -1,9 +1,71 @@
+import functools
 import numpy as np
 from typing import Any, Union
 
 import bilby
 from scipy.special import gammaln
 
+try:
+    import numexpr
+except ModuleNotFoundError:
+    numexpr = None
+
+# Below this many elements numexpr's call overhead outweighs the gain from fusing the reduction.
+_NUMEXPR_MIN_SIZE = 4096
+
+
+def _use_numexpr(array: np.ndarray) -> bool:
+    return numexpr is not None and np.size(array) >= _NUMEXPR_MIN_SIZE
+
+
+def _chi_square(res: np.ndarray, sigma: Union[float, np.ndarray], overwrite_res: bool = False) -> float:
+    """Sum of the squared normalised residuals, evaluated in a single pass with numexpr if available.
+
+    :param res: The residuals.
+    :type res: np.ndarray
+    :param sigma: The standard deviation of the noise.
+    :type sigma: Union[float, np.ndarray]
+    :param overwrite_res: Whether `res` may be used as scratch space to avoid temporary arrays.
+    :type overwrite_res: bool
+    :return: The chi-square.
+    :rtype: float
+    """
+    if _use_numexpr(res):
+        return float(numexpr.evaluate("sum((res / sigma) ** 2)", local_dict=dict(res=res, sigma=sigma)))
+    if overwrite_res and np.broadcast(res, sigma).shape == np.shape(res):
+        np.divide(res, sigma, out=res)
+        np.square(res, out=res)
+        return np.sum(res)
+    return np.sum((res / sigma) ** 2)
+
+
+def _poisson_rate_term(rate: Union[float, np.ndarray], counts: np.ndarray) -> float:
+    """Rate dependent part of the Poisson log-likelihood, evaluated in a single pass with numexpr if available.
+
+    :param rate: The expected number of counts in each bin.
+    :type rate: Union[float, np.ndarray]
+    :param counts: The observed number of counts in each bin.
+    :type counts: np.ndarray
+    :return: sum(counts * log(rate) - rate)
+    :rtype: float
+    """
+    if _use_numexpr(counts):
+        return float(numexpr.evaluate(
+            "sum(counts * log(rate) - rate)", local_dict=dict(rate=rate, counts=counts)))
+    return np.sum(-rate + counts * np.log(rate))
+
+
+@functools.lru_cache(maxsize=128)
+def _infer_parameters(function: callable) -> tuple:
+    """Cached parameter inference so that repeatedly building likelihoods for one model inspects it only once.
+
+    :param function: The model/function that we want to fit.
+    :type function: callable
+    :return: The names of the parameters of `function`.
+    :rtype: tuple
+    """
+    return tuple(bilby.core.utils.introspection.infer_parameters_from_function(func=function))
+
 
 class _RedbackLikelihood(bilby.Likelihood):
 
@@ -24,8 +86,7 @@ class _RedbackLikelihood(bilby.Likelihood):
         self.function = function
         self.kwargs = kwargs
 
-        parameters = bilby.core.utils.introspection.infer_parameters_from_function(func=function)
-        super().__init__(parameters=dict.fromkeys(parameters))
+        super().__init__(parameters=dict.fromkeys(_infer_parameters(function)))
 
     @property
     def kwargs(self) -> dict:
@@ -70,6 +131,7 @@ class GaussianLikelihood(_RedbackLikelihood):
         """
 
         self._noise_log_likelihood = None
+        self._residual_buffer = None
         super().__init__(x=x, y=y, function=function, kwargs=kwargs)
         self.sigma = sigma
         if self.sigma is None:
@@ -81,6 +143,7 @@ class GaussianLikelihood(_RedbackLikelihood):
 
     @sigma.setter
     def sigma(self, sigma: Union[float, None, np.ndarray]) -> None:
+        self._log_normalisation = None
         if sigma is None:
             self._sigma = sigma
         elif isinstance(sigma, float) or isinstance(sigma, int):
@@ -92,10 +155,35 @@ class GaussianLikelihood(_RedbackLikelihood):
         else:
             raise ValueError('Sigma must be either float or array-like x.')
 
+    @property
+    def log_normalisation(self) -> float:
+        """
+        :return: The normalisation term of the Gaussian log-likelihood. Cached if sigma is not sampled over.
+        :rtype: float
+        """
+        if 'sigma' in self.parameters:
+            return self._gaussian_log_normalisation(sigma=self.sigma, n=self.n)
+        if self._log_normalisation is None:
+            self._log_normalisation = self._gaussian_log_normalisation(sigma=self.sigma, n=self.n)
+        return self._log_normalisation
+
     @property
     def residual(self) -> np.ndarray:
         return self.y - self.function(self.x, **self.parameters, **self.kwargs)
 
+    def _buffered_residual(self) -> np.ndarray:
+        """Residual written into a buffer that is reused across calls. Only valid until the next call.
+
+        :return: The residual.
+        :rtype: np.ndarray
+        """
+        model = self.function(self.x, **self.parameters, **self.kwargs)
+        if np.shape(model) != np.shape(self.y):
+            return self.y - model
+        if self._residual_buffer is None or self._residual_buffer.shape != np.shape(self.y):
+            self._residual_buffer = np.empty(np.shape(self.y), dtype=np.float64)
+        return np.subtract(self.y, model, out=self._residual_buffer)
+
     def noise_log_likelihood(self) -> float:
         """
         :return: The noise log-likelihood, i.e. the log-likelihood assuming the signal is just noise.
@@ -110,11 +198,23 @@ class GaussianLikelihood(_RedbackLikelihood):
         :return: The log-likelihood.
         :rtype: float
         """
-        return np.nan_to_num(self._gaussian_log_likelihood(res=self.residual, sigma=self.sigma))
+        return np.nan_to_num(self._gaussian_log_likelihood(
+            res=self._buffered_residual(), sigma=self.sigma, log_normalisation=self.log_normalisation,
+            overwrite_res=True))
+
+    @staticmethod
+    def _gaussian_log_likelihood(
+            res: np.ndarray, sigma: Union[float, np.ndarray], log_normalisation: float = None,
+            overwrite_res: bool = False) -> Any:
+        if log_normalisation is None:
+            log_normalisation = GaussianLikelihood._gaussian_log_normalisation(sigma=sigma, n=np.size(res))
+        return -0.5 * _chi_square(res=res, sigma=sigma, overwrite_res=overwrite_res) + log_normalisation
 
     @staticmethod
-    def _gaussian_log_likelihood(res: np.ndarray, sigma: Union[float, np.ndarray]) -> Any:
-        return np.sum(- (res / sigma) ** 2 / 2 - np.log(2 * np.pi * sigma ** 2) / 2)
+    def _gaussian_log_normalisation(sigma: Union[float, np.ndarray], n: int) -> Any:
+        if np.ndim(sigma) == 0:
+            return -0.5 * n * np.log(2 * np.pi * sigma ** 2)
+        return -0.5 * np.sum(np.log(2 * np.pi * sigma ** 2))
 
 
 class GaussianLikelihoodUniformXErrors(GaussianLikelihood):
@@ -169,7 +269,9 @@ class GaussianLikelihoodUniformXErrors(GaussianLikelihood):
         :return: The log-likelihood due to y-errors.
         :rtype: float
         """
-        return self._gaussian_log_likelihood(res=self.residual, sigma=self.sigma)
+        return self._gaussian_log_likelihood(
+            res=self._buffered_residual(), sigma=self.sigma, log_normalisation=self.log_normalisation,
+            overwrite_res=True)
 
     def log_likelihood(self) -> float:
         """
@@ -228,7 +330,8 @@ class GaussianLikelihoodQuadratureNoise(GaussianLikelihood):
         :return: The log-likelihood.
         :rtype: float
         """
-        return np.nan_to_num(self._gaussian_log_likelihood(res=self.residual, sigma=self.full_sigma))
+        return np.nan_to_num(self._gaussian_log_likelihood(
+            res=self._buffered_residual(), sigma=self.full_sigma, overwrite_res=True))
 
 class GaussianLikelihoodWithSystematicNoise(GaussianLikelihood):
     def __init__(
@@ -280,7 +383,8 @@ class GaussianLikelihoodWithSystematicNoise(GaussianLikelihood):
         :return: The log-likelihood.
         :rtype: float
         """
-        return np.nan_to_num(self._gaussian_log_likelihood(res=self.residual, sigma=self.full_sigma))
+        return np.nan_to_num(self._gaussian_log_likelihood(
+            res=self._buffered_residual(), sigma=self.full_sigma, overwrite_res=True))
 
 class GaussianLikelihoodQuadratureNoiseNonDetections(GaussianLikelihoodQuadratureNoise):
     def __init__(
@@ -320,7 +424,8 @@ class GaussianLikelihoodQuadratureNoiseNonDetections(GaussianLikelihoodQuadratur
         :return: The log-likelihood due to y-errors.
         :rtype: float
         """
-        return self._gaussian_log_likelihood(res=self.residual, sigma=self.full_sigma)
+        return self._gaussian_log_likelihood(
+            res=self._buffered_residual(), sigma=self.full_sigma, overwrite_res=True)
 
     def log_likelihood_upper_limit(self) -> Any:
         """
@@ -393,6 +498,7 @@ class PoissonLikelihood(_RedbackLikelihood):
         self.integrated_rate_function = integrated_rate_function
         self.dt = dt
         self.parameters['background_rate'] = 0
+        self._log_counts_factorial = np.sum(gammaln(self.counts + 1))
 
     @property
     def time(self) -> np.ndarray:
@@ -434,4 +540,4 @@ class PoissonLikelihood(_RedbackLikelihood):
         return np.nan_to_num(self._poisson_log_likelihood(rate=rate))
 
     def _poisson_log_likelihood(self, rate: Union[float, np.ndarray]) -> Any:
-        return np.sum(-rate + self.counts * np.log(rate) - gammaln(self.counts + 1))
+        return _poisson_rate_term(rate=rate, counts=self.counts) - self._log_counts_factorial
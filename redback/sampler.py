@@ -1,3 +1,5 @@
+import copy
+import functools
 import matplotlib.pyplot as plt
 import os
 from pathlib import Path
@@ -6,6 +8,7 @@ from typing import Union
 import bilby
 
 import redback.get_data
+import redback.priors
 from redback.likelihoods import GaussianLikelihood, PoissonLikelihood
 from redback.model_library import all_models_dict
 from redback.result import RedbackResult
@@ -40,7 +43,8 @@ def fit_model(
     :param resume: Whether to resume the run from a checkpoint if available.
     :param save_format: The format to save the result in. (Default value = 'json'_
     :param model_kwargs: Additional keyword arguments for the model.
-    :param kwargs: Additional parameters that will be passed to the sampler
+    :param kwargs: Additional parameters that will be passed to the sampler, e.g. `npool` to evaluate the likelihood
+                   on that many processes, or `pool` to use an existing pool such as a `schwimmbad.MPIPool`.
     :param plot: If True, create corner and lightcurve plot
     :return: Redback result object, transient specific data object
     """
@@ -53,43 +57,45 @@ def fit_model(
                 f"Transient data mode {transient.data_mode} is inconsistent with "
                 f"output format {model_kwargs['output_format']}. These should be the same.")
 
-    prior = prior or bilby.prior.PriorDict(filename=f"{dirname}/Priors/{model}.prior")
+    prior = prior or _get_default_prior(model.__name__)
     outdir = outdir or f"{transient.directory_structure.directory_path}/{model.__name__}"
     Path(outdir).mkdir(parents=True, exist_ok=True)
     label = label or transient.name
 
-    if isinstance(transient, Afterglow):
-        return _fit_grb(
-            transient=transient, model=model, outdir=outdir, label=label, sampler=sampler, nlive=nlive, prior=prior,
-            walks=walks, use_photon_index_prior=use_photon_index_prior, resume=resume, save_format=save_format,
-            model_kwargs=model_kwargs, truncate=truncate, truncate_method=truncate_method, plot=plot, **kwargs)
-    elif isinstance(transient, PromptTimeSeries):
-        return _fit_prompt(
-            transient=transient, model=model, outdir=outdir, label=label, sampler=sampler, nlive=nlive, prior=prior,
-            walks=walks, resume=resume, save_format=save_format, model_kwargs=model_kwargs, plot=plot, **kwargs)
-    elif isinstance(transient, OpticalTransient):
-        return _fit_optical_transient(
-            transient=transient, model=model, outdir=outdir, label=label, sampler=sampler, nlive=nlive, prior=prior,
-            walks=walks, truncate=truncate, use_photon_index_prior=use_photon_index_prior,
-            truncate_method=truncate_method, resume=resume, save_format=save_format, model_kwargs=model_kwargs,
-            plot=plot, **kwargs)
-    elif isinstance(transient, Transient):
-        return _fit_optical_transient(
-            transient=transient, model=model, outdir=outdir, label=label, sampler=sampler, nlive=nlive, prior=prior,
-            walks=walks, truncate=truncate, use_photon_index_prior=use_photon_index_prior,
-            truncate_method=truncate_method, resume=resume, save_format=save_format, model_kwargs=model_kwargs,
-            plot=plot, **kwargs)
-    else:
+    fit_function = next((_fit_functions[cls] for cls in type(transient).__mro__ if cls in _fit_functions), None)
+    if fit_function is None:
         raise ValueError(f'Source type {transient.__class__.__name__} not known')
+    if fit_function is not _fit_prompt:
+        kwargs.update(truncate=truncate, use_photon_index_prior=use_photon_index_prior, truncate_method=truncate_method)
+    return fit_function(
+        transient=transient, model=model, outdir=outdir, label=label, sampler=sampler, nlive=nlive, prior=prior,
+        walks=walks, resume=resume, save_format=save_format, model_kwargs=model_kwargs, plot=plot, **kwargs)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_prior(model_name: str) -> bilby.prior.PriorDict:
+    """Loads the default priors of a model once per session. Deep copy before modifying.
+
+    :param model_name: Name of the model.
+    :return: The default priors for the model.
+    """
+    return redback.priors.get_priors(model=model_name)
 
 
+def _get_default_prior(model_name: str) -> bilby.prior.PriorDict:
+    """
+    :param model_name: Name of the model.
+    :return: An independent copy of the cached default priors, safe to modify for a single fit.
+    """
+    return copy.deepcopy(_load_prior(model_name))
+
 
 def _fit_grb(transient, model, outdir, label, likelihood=None, sampler='dynesty', nlive=3000, prior=None, walks=1000,
              use_photon_index_prior=False, resume=True, save_format='json', model_kwargs=None, plot=True, **kwargs):
     if use_photon_index_prior:
         label += '_photon_index'
         if transient.photon_index < 0.:
-            logger.info('photon index for GRB', transient.name, 'is negative. Using default prior on alpha_1')
+            logger.info('photon index for GRB %s is negative. Using default prior on alpha_1', transient.name)
             prior['alpha_1'] = bilby.prior.Uniform(-10, -0.5, 'alpha_1', latex_label=r'$\alpha_{1}$')
         else:
             prior['alpha_1'] = bilby.prior.Gaussian(mu=-(transient.photon_index + 1), sigma=0.1,
@@ -107,7 +113,7 @@ def _fit_grb(transient, model, outdir, label, likelihood=None, sampler='dynesty'
     meta_data.update(transient_kwargs)
     model_kwargs = redback.utils.check_kwargs_validity(model_kwargs)
     meta_data['model_kwargs'] = model_kwargs
-    nthreads = kwargs.get('nthreads', 1)
+    npool = kwargs.pop('npool', kwargs.pop('nthreads', 1))
 
     result = None
     if not kwargs.get("clean", False):
@@ -123,7 +129,7 @@ def _fit_grb(transient, model, outdir, label, likelihood=None, sampler='dynesty'
         likelihood=likelihood, priors=prior, label=label, sampler=sampler, nlive=nlive,
         outdir=outdir, plot=plot, use_ratio=False, walks=walks, resume=resume,
         maxmcmc=10 * walks, result_class=RedbackResult, meta_data=meta_data,
-        nthreads=nthreads, save_bounds=False, nsteps=nlive, nwalkers=walks, save=save_format, **kwargs)
+        npool=npool, save_bounds=False, nsteps=nlive, nwalkers=walks, save=save_format, **kwargs)
     plt.close('all')
     if plot:
         result.plot_lightcurve(model=model)
@@ -145,7 +151,7 @@ def _fit_optical_transient(transient, model, outdir, label, likelihood=None, sam
     meta_data.update(transient_kwargs)
     model_kwargs = redback.utils.check_kwargs_validity(model_kwargs)
     meta_data['model_kwargs'] = model_kwargs
-    nthreads = kwargs.get('nthreads', 1)
+    npool = kwargs.pop('npool', kwargs.pop('nthreads', 1))
 
     result = None
     if not kwargs.get("clean", False):
@@ -161,7 +167,7 @@ def _fit_optical_transient(transient, model, outdir, label, likelihood=None, sam
         likelihood=likelihood, priors=prior, label=label, sampler=sampler, nlive=nlive,
         outdir=outdir, plot=plot, use_ratio=False, walks=walks, resume=resume,
         maxmcmc=10 * walks, result_class=RedbackResult, meta_data=meta_data,
-        nthreads=nthreads, save_bounds=False, nsteps=nlive, nwalkers=walks, save=save_format, **kwargs)
+        npool=npool, save_bounds=False, nsteps=nlive, nwalkers=walks, save=save_format, **kwargs)
     plt.close('all')
     if plot:
         result.plot_lightcurve(model=model)
@@ -181,7 +187,7 @@ def _fit_prompt(transient, model, outdir, label, likelihood=None, integrated_rat
     meta_data.update(transient_kwargs)
     model_kwargs = redback.utils.check_kwargs_validity(model_kwargs)
     meta_data['model_kwargs'] = model_kwargs
-    nthreads = kwargs.get('nthreads', 1)
+    npool = kwargs.pop('npool', kwargs.pop('nthreads', 1))
 
     result = None
     if not kwargs.get("clean", False):
@@ -197,8 +203,16 @@ def _fit_prompt(transient, model, outdir, label, likelihood=None, integrated_rat
         likelihood=likelihood, priors=prior, label=label, sampler=sampler, nlive=nlive,
         outdir=outdir, plot=False, use_ratio=False, walks=walks, resume=resume,
         maxmcmc=10 * walks, result_class=RedbackResult, meta_data=meta_data,
-        nthreads=nthreads, save_bounds=False, nsteps=nlive, nwalkers=walks, save=save_format, **kwargs)
+        npool=npool, save_bounds=False, nsteps=nlive, nwalkers=walks, save=save_format, **kwargs)
     plt.close('all')
     if plot:
         result.plot_lightcurve(model=model)
     return result
+
+
+# Keyed by transient class; fit_model uses the entry for the most specific class in the transient's MRO.
+_fit_functions = {
+    Afterglow: _fit_grb,
+    PromptTimeSeries: _fit_prompt,
+    OpticalTransient: _fit_optical_transient,
+    Transient: _fit_optical_transient}
@@ -1,5 +1,7 @@
 from typing import Union
 
+import astropy.constants as cc
+import astropy.units as uu
 import numpy as np
 from sncosmo import TimeSeriesSource
 
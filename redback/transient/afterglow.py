@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from os.path import join
 from typing import Union
@@ -198,9 +199,10 @@ class Afterglow(Transient):
         """
         directory_structure = afterglow_directory_structure(grb=f"GRB{name.lstrip('GRB')}", data_mode=data_mode)
 
-        data = np.genfromtxt(directory_structure.processed_file_path, delimiter=",")[1:]
-        x = data[:, 0]
-        x_err = data[:, 1:3].T
+        processed_file_path = directory_structure.processed_file_path
+        data = _read_processed_file(processed_file_path, modified_time=os.stat(processed_file_path).st_mtime_ns)
+        x = np.array(data[:, 0])
+        x_err = np.array(data[:, 1:3].T)
         y = np.array(data[:, 3])
         y_err = np.array(np.abs(data[:, 4:6].T))
         return x, x_err, y, y_err
@@ -358,6 +360,23 @@ class Afterglow(Transient):
         self._save_luminosity_data()
 
 
+@functools.lru_cache(maxsize=64)
+def _read_processed_file(processed_file_path: str, modified_time: int) -> np.ndarray:
+    """Reads a processed afterglow data file. Cached so that fitting several models to the same GRB parses it once.
+
+    :param processed_file_path: Path to the processed csv file.
+    :type processed_file_path: str
+    :param modified_time: Modification time of the file in ns, so that the cache is invalidated if the file changes.
+    :type modified_time: int
+
+    :return: The data without the header row. Read-only, copy before modifying.
+    :rtype: np.ndarray
+    """
+    data = np.genfromtxt(processed_file_path, delimiter=",")[1:]
+    data.setflags(write=False)
+    return data
+
+
 class SGRB(Afterglow):
     """ """
     pass
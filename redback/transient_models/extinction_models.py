@@ -1,37 +1,42 @@
+import functools
+import threading
+from collections import OrderedDict
 from inspect import isfunction
 import numpy as np
 
 import redback.utils
 from redback.transient_models.fireball_models import predeceleration
-from redback.utils import logger, calc_ABmag_from_flux_density, citation_wrapper, lambda_to_nu
-import astropy.units as uu
+from redback.utils import logger, calc_ABmag_from_flux_density_value, citation_wrapper, lambda_to_nu
 import redback.sed as sed
 from redback.constants import day_to_s
 
-extinction_afterglow_base_models = ['tophat', 'cocoon', 'gaussian',
-                                    'kn_afterglow', 'cone_afterglow',
-                                    'gaussiancore', 'gaussian',
-                                    'smoothpowerlaw', 'powerlawcore',
-                                    'tophat']
+extinction_afterglow_base_models = frozenset({'tophat', 'cocoon', 'gaussian',
+                                              'kn_afterglow', 'cone_afterglow',
+                                              'gaussiancore', 'smoothpowerlaw', 'powerlawcore'})
 extinction_integrated_flux_afterglow_models = extinction_afterglow_base_models
-extinction_supernova_base_models = ['sn_exponential_powerlaw', 'arnett', 'shock_cooling_and_arnett',
-                                    'basic_magnetar_powered', 'slsn', 'magnetar_nickel',
-                                    'csm_interaction', 'csm_nickel', 'type_1a', 'type_1c',
-                                    'general_magnetar_slsn']
-extinction_kilonova_base_models = ['nicholl_bns', 'mosfit_rprocess', 'mosfit_kilonova',
-                                   'power_law_stratified_kilonova','bulla_bns_kilonova',
-                                   'bulla_nsbh_kilonova', 'kasen_nsbh_kilonova','two_layer_stratified_kilonova',
-                                   'three_component_kilonova_model', 'two_component_kilonova_model',
-                                   'one_component_kilonova_model', 'one_component_ejecta_relation',
-                                   'one_component_ejecta_relation_projection', 'two_component_bns_ejecta_relation',
-                                   'polytrope_eos_two_component_bns', 'one_component_nsbh_ejecta_relation',
-                                   'two_component_nsbh_ejecta_relation','metzger_kilonova_model']
-extinction_tde_base_models = ['tde_analytical', 'tde_semianalytical', 'gaussianrise_metzger_tde']
-extinction_magnetar_driven_base_models = ['basic_mergernova', 'general_mergernova', 'general_mergernova_thermalisation',
-                                          'general_mergernova_evolution', 'metzger_magnetar_driven_kilonova_model',
-                                          'general_metzger_magnetar_driven', 'general_magnetar_driven_thermalisation',
-                                          'general_metzger_magnetar_driven_evolution']
-extinction_shock_powered_base_models = ['shocked_cocoon', 'shock_cooling']
+extinction_supernova_base_models = frozenset({'sn_exponential_powerlaw', 'arnett', 'shock_cooling_and_arnett',
+                                              'basic_magnetar_powered', 'slsn', 'magnetar_nickel',
+                                              'csm_interaction', 'csm_nickel', 'type_1a', 'type_1c',
+                                              'general_magnetar_slsn'})
+extinction_kilonova_base_models = frozenset({'nicholl_bns', 'mosfit_rprocess', 'mosfit_kilonova',
+                                             'power_law_stratified_kilonova', 'bulla_bns_kilonova',
+                                             'bulla_nsbh_kilonova', 'kasen_nsbh_kilonova',
+                                             'two_layer_stratified_kilonova', 'three_component_kilonova_model',
+                                             'two_component_kilonova_model', 'one_component_kilonova_model',
+                                             'one_component_ejecta_relation',
+                                             'one_component_ejecta_relation_projection',
+                                             'two_component_bns_ejecta_relation', 'polytrope_eos_two_component_bns',
+                                             'one_component_nsbh_ejecta_relation',
+                                             'two_component_nsbh_ejecta_relation', 'metzger_kilonova_model'})
+extinction_tde_base_models = frozenset({'tde_analytical', 'tde_semianalytical', 'gaussianrise_metzger_tde'})
+extinction_magnetar_driven_base_models = frozenset({'basic_mergernova', 'general_mergernova',
+                                                    'general_mergernova_thermalisation',
+                                                    'general_mergernova_evolution',
+                                                    'metzger_magnetar_driven_kilonova_model',
+                                                    'general_metzger_magnetar_driven',
+                                                    'general_magnetar_driven_thermalisation',
+                                                    'general_metzger_magnetar_driven_evolution'})
+extinction_shock_powered_base_models = frozenset({'shocked_cocoon', 'shock_cooling'})
 
 extinction_model_library = {'kilonova': extinction_kilonova_base_models,
                             'supernova': extinction_supernova_base_models,
@@ -46,6 +51,80 @@ model_library = {'supernova': 'supernova_models', 'afterglow': 'afterglow_models
                  'kilonova': 'kilonova_models', 'shock_powered': 'shock_powered_models',
                  'integrated_flux_afterglow': 'afterglow_models'}
 
+# Number of recent base model outputs kept when an extinction model is called with _cache=True.
+# The memo is off by default: samplers rarely revisit identical points, so keying every call would cost more than
+# the rare hits save. It pays off when the same point is evaluated repeatedly, e.g. when plotting a fixed sample.
+_BASE_MODEL_CACHE_SIZE = 16
+_base_model_cache = OrderedDict()
+_base_model_cache_lock = threading.Lock()
+
+def _base_model_cache_key(function, time, kwargs):
+    """
+    :param function: base model function
+    :param time: time in days
+    :param kwargs: keyword arguments for the base model
+    :return: hashable key identifying the call, or None if an argument cannot be keyed safely
+    """
+    items = []
+    for name, value in sorted(kwargs.items()) + [('time', time)]:
+        if value is function:
+            # the base model passed as a function is already part of the key
+            value = None
+        elif isinstance(value, np.ndarray):
+            if value.dtype == object:
+                return None
+            value = (value.shape, value.dtype.str, value.tobytes())
+        elif not isinstance(value, (int, float, str, np.number, type(None))):
+            return None
+        items.append((name, value))
+    return function, tuple(items)
+
+def _read_only_copy(output):
+    """
+    :param output: base model output
+    :return: copy of the output whose arrays cannot be modified, or None if the output type cannot be frozen
+    """
+    if isinstance(output, np.ndarray):
+        output = output.copy()
+        output.setflags(write=False)
+        return output
+    if isinstance(output, tuple) and hasattr(output, '_fields'):
+        fields = {field: _read_only_copy(getattr(output, field)) for field in output._fields}
+        if any(value is None for value in fields.values()):
+            return None
+        return output._replace(**fields)
+    if isinstance(output, (int, float, np.number)):
+        return output
+    return None
+
+def _cached_base_model_call(function, time, use_cache=False, **kwargs):
+    """
+    Evaluates the base model, reusing the output of a recent call with identical arguments if use_cache is True.
+    The cache is shared between threads and guarded by a lock.
+
+    :param function: base model function
+    :param time: time in days
+    :param use_cache: whether to look up and store the output in the cache
+    :param kwargs: keyword arguments for the base model
+    :return: the base model output. Outputs served from the cache are read-only.
+    """
+    key = _base_model_cache_key(function, time, kwargs) if use_cache else None
+    if key is None:
+        return function(time, **kwargs)
+    with _base_model_cache_lock:
+        output = _base_model_cache.get(key)
+        if output is not None:
+            _base_model_cache.move_to_end(key)
+            return output
+    output = function(time, **kwargs)
+    frozen = _read_only_copy(output)
+    if frozen is not None:
+        with _base_model_cache_lock:
+            _base_model_cache[key] = frozen
+            if len(_base_model_cache) > _BASE_MODEL_CACHE_SIZE:
+                _base_model_cache.popitem(last=False)
+    return output
+
 def _get_correct_function(base_model, model_type=None):
     """
     Gets the correct function to use for the base model specified
@@ -54,40 +133,46 @@ def _get_correct_function(base_model, model_type=None):
     :param model_type: type of model, could be None if using a function as input
     :return: function; function to evaluate
     """
-    from redback.model_library import modules_dict  # import model library in function to avoid circular dependency
-    extinction_base_models = extinction_model_library[model_type]
-    module_libary = model_library[model_type]
-
     if isfunction(base_model):
-        function = base_model
-
-    elif base_model not in extinction_base_models:
-        logger.warning('{} is not implemented as a base model'.format(base_model))
+        return base_model
+    if base_model not in extinction_model_library[model_type]:
+        logger.warning('%s is not implemented as a base model', base_model)
         raise ValueError('Please choose a different base model')
-    elif isinstance(base_model, str):
-        function = modules_dict[module_libary][base_model]
-    else:
-        raise ValueError("Not a valid base model.")
+    from redback.model_library import modules_dict  # import model library in function to avoid circular dependency
+    return modules_dict[model_library[model_type]][base_model]
 
-    return function
+@functools.lru_cache(maxsize=8)
+def _fitzpatrick99(r_v):
+    """
+    Cached Fitzpatrick (1999) extinction law, so the spline for a given r_v is only built once per session.
 
-def _perform_extinction(flux_density, angstroms, av, r_v):
+    :param r_v: extinction parameter
+    :return: callable taking wavelengths in angstroms and av, returning the extinction in magnitudes
+    """
+    import extinction  # noqa
+    return extinction.Fitzpatrick99(r_v)
+
+def _perform_extinction(flux_density, angstroms, av, r_v, inplace=False):
     """
     :param flux_density: flux density in mjy outputted by the model
     :param angstroms: wavelength in angstroms
     :param av: absolute mag extinction
     :param r_v: extinction parameter
+    :param inplace: whether flux_density may be overwritten. Ignored unless it is a writeable float64 array
+        of the output shape.
     :return: flux
     """
     import extinction  # noqa
     import numpy.ma as ma
     if isinstance(angstroms, float):
         angstroms = np.array([angstroms])    
-    mag_extinction = extinction.fitzpatrick99(angstroms, av, r_v=r_v)
+    mag_extinction = _fitzpatrick99(r_v)(angstroms, av)
     if av < 10:
         mask= mag_extinction > 10
         mag_extinction[mask]=0    
-    flux_density = extinction.apply(mag_extinction, flux_density)
+    inplace = (inplace and getattr(flux_density, 'dtype', None) == np.float64 and flux_density.flags.writeable
+               and np.broadcast(mag_extinction, flux_density).shape == flux_density.shape)
+    flux_density = extinction.apply(mag_extinction, flux_density, inplace=inplace)
     return flux_density
 
 def _evaluate_extinction_model(time, av, model_type, **kwargs):
@@ -98,35 +183,40 @@ def _evaluate_extinction_model(time, av, model_type, **kwargs):
     :param av: absolute mag extinction
     :param model_type: None, or one of the types implemented
     :param kwargs: Must be all the parameters required by the base_model specified using kwargs['base_model']
-        and r_v, default is 3.1
+        and r_v, default is 3.1. Pass _cache=True to reuse base model outputs of recent identical calls.
     :return: set by kwargs['output_format'] - 'flux_density', 'magnitude', 'flux' with extinction applied
     """
+    # extinction-only arguments are not forwarded to the base model
+    use_cache = kwargs.pop('_cache', False)
+    r_v = kwargs.pop('r_v', 3.1)
     base_model = kwargs['base_model']
+    # library base models return freshly allocated arrays, so their output can be attenuated in place.
+    # A user function may return an array it reuses, and cached outputs are read-only.
+    inplace = isinstance(base_model, str)
     if kwargs['base_model'] in ['thin_shell_supernova', 'homologous_expansion_supernova']:
         kwargs['base_model'] = kwargs.get('submodel', 'arnett_bolometric')
     if kwargs['output_format'] == 'flux_density':
-        frequency = kwargs['frequency']
-        if isinstance(frequency, float):
-            frequency = np.ones(len(time)) * frequency
+        # one frequency per time, so the extinction curve is evaluated in a single vectorised pass
+        frequency = np.asarray(kwargs['frequency'], dtype=np.float64)
+        if frequency.ndim == 0:
+            frequency = np.full(len(time), frequency)
         angstroms = redback.utils.nu_to_lambda(frequency)
-        temp_kwargs = kwargs.copy()
-        temp_kwargs['output_format'] = 'flux_density'
         function = _get_correct_function(base_model=base_model, model_type=model_type)
-        flux_density = function(time, **temp_kwargs)
-        r_v = kwargs.get('r_v', 3.1)
-        flux_density = _perform_extinction(flux_density=flux_density, angstroms=angstroms, av=av, r_v=r_v)
+        flux_density = _cached_base_model_call(function, time, use_cache=use_cache, **kwargs)
+        flux_density = _perform_extinction(flux_density=flux_density, angstroms=angstroms, av=av, r_v=r_v,
+                                           inplace=inplace)
         return flux_density
     else:
         temp_kwargs = kwargs.copy()
         temp_kwargs['output_format'] = 'spectra'
         time_obs = time
         function = _get_correct_function(base_model=base_model, model_type=model_type)
-        spectra_tuple = function(time, **temp_kwargs)
+        spectra_tuple = _cached_base_model_call(function, time, use_cache=use_cache, **temp_kwargs)
         flux_density = spectra_tuple.spectra
         lambdas = spectra_tuple.lambdas
         time_observer_frame = spectra_tuple.time
-        r_v = kwargs.get('r_v', 3.1)
-        flux_density = _perform_extinction(flux_density=flux_density, angstroms=lambdas, av=av, r_v=r_v)
+        flux_density = _perform_extinction(flux_density=flux_density, angstroms=lambdas, av=av, r_v=r_v,
+                                           inplace=inplace)
         return sed.get_correct_output_format_from_spectra(time=time_obs, time_eval=time_observer_frame,
                                                               spectra=flux_density, lambda_array=spectra_tuple.lambdas,
                                                               **kwargs)
@@ -259,16 +349,14 @@ def _extinction_with_predeceleration(time, lognh, factor, **kwargs):
     """
     import extinction  # noqa
     lc = predeceleration(time, **kwargs)
-    lc = np.nan_to_num(lc)
+    lc = np.nan_to_num(lc, copy=False)
     factor = factor * 1e21
     nh = 10 ** lognh
     av = nh / factor
-    frequency = kwargs['frequency']
-    # convert to angstrom
-    frequency = (frequency * uu.Hz).to(uu.Angstrom).value
-    mag_extinction = extinction.fitzpatrick99(frequency, av, r_v=3.1)
+    angstroms = np.atleast_1d(redback.utils.nu_to_lambda(kwargs['frequency']))
+    mag_extinction = _fitzpatrick99(3.1)(angstroms, av)
     lc = extinction.apply(mag_extinction, lc, inplace=True)
     if kwargs['output_format'] == 'flux_density':
         return lc
     elif kwargs['output_format'] == 'magnitude':
-        return calc_ABmag_from_flux_density(lc).value
\ No newline at end of file
+        return calc_ABmag_from_flux_density_value(lc)
\ No newline at end of file
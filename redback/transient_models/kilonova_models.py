@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+import astropy.constants as cc
+import astropy.units as uu
 from astropy.table import Table, Column
 from scipy.interpolate import interp1d, RegularGridInterpolator
 from astropy.cosmology import Planck18 as cosmo  # noqa
@@ -1,6 +1,7 @@
 import numpy as np
 from collections import namedtuple
 from scipy import special
+import astropy.units as uu
 from redback.constants import *
 import redback.sed as sed
 from astropy.cosmology import Planck18 as cosmo  # noqa
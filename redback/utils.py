@@ -1,3 +1,4 @@
+import atexit
 import contextlib
 import logging
 import os
@@ -5,6 +6,7 @@ from collections import namedtuple
 from inspect import getmembers, isfunction
 from pathlib import Path
 
+import astropy.units as uu
 from astropy.time import Time
 import bilby
 import matplotlib.pyplot as plt
@@ -306,6 +308,19 @@ def calc_ABmag_from_flux_density(fluxdensity):
     """
     return (fluxdensity * uu.mJy).to(uu.ABmag)
 
+# AB magnitude of a 1 mJy source, as defined by astropy.units.ABmag.
+_ABMAG_OF_ONE_MJY = (1 * uu.mJy).to(uu.ABmag).value
+
+def calc_ABmag_from_flux_density_value(fluxdensity):
+    """
+    Calculate AB magnitude from flux density assuming monochromatic AB filter,
+    without constructing astropy quantities. Use in model evaluations.
+
+    :param fluxdensity: flux density in mJy
+    :return: AB magnitude as a plain float or array
+    """
+    return -2.5 * np.log10(fluxdensity) + _ABMAG_OF_ONE_MJY
+
 def calc_flux_density_from_vegamag(magnitudes, zeropoint):
     """
     Calculate flux density from Vega magnitude assuming Vega filter
@@ -552,6 +567,40 @@ def fetch_driver():
     return webdriver.PhantomJS()
 
 
+_shared_driver = None
+_shared_driver_quit_registered = False
+
+
+def fetch_shared_driver():
+    """
+    Returns a webdriver that is shared between downloads so the browser only starts once per session.
+    The driver is quit when the interpreter exits.
+
+    :return: The shared webdriver
+    """
+    global _shared_driver, _shared_driver_quit_registered
+    if _shared_driver is None:
+        _shared_driver = fetch_driver()
+        if not _shared_driver_quit_registered:
+            atexit.register(reset_shared_driver)
+            _shared_driver_quit_registered = True
+    return _shared_driver
+
+
+def reset_shared_driver():
+    """
+    Quits the shared webdriver so the next call to `fetch_shared_driver` starts a fresh one.
+    Use this after a `WebDriverException`, the old driver may be dead.
+    """
+    global _shared_driver
+    driver, _shared_driver = _shared_driver, None
+    if driver is not None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f'Could not quit the shared webdriver: {e}')
+
+
 def calc_credible_intervals(samples, interval=0.9):
     """
     Calculate credible intervals from samples
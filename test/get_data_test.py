@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, PropertyMock
 import numpy as np
 import pandas as pd
 import requests
+from selenium.common.exceptions import WebDriverException
 
 import redback
 
@@ -24,6 +25,10 @@ class TestUtils(unittest.TestCase):
         trigger = redback.get_data.utils.get_trigger_number("041223")
         self.assertEqual("100585", trigger)
 
+    def test_trigger_number_not_found(self):
+        with self.assertRaises(redback.get_data.utils.TriggerNotFoundError):
+            redback.get_data.utils.get_trigger_number("GRB000000Z")
+
     def test_get_grb_table(self):
         expected_keys = ['GRB', 'Time [UT]', 'Trigger Number', 'BAT RA (J2000)',
                          'BAT Dec (J2000)', 'BAT T90 [sec]',
@@ -39,6 +44,32 @@ class TestUtils(unittest.TestCase):
         table = redback.get_data.utils.get_grb_table()
         self.assertListEqual(expected_keys, list(table.keys()))
 
+    @mock.patch("redback.get_data.utils.session.get")
+    def test_download_file(self, get):
+        filename = "test_download_file.txt"
+        response = get.return_value.__enter__.return_value
+        response.iter_content.return_value = [b"some ", b"data"]
+        try:
+            redback.get_data.utils.download_file(url="https://www.example.com", filename=filename)
+            get.assert_called_once_with("https://www.example.com", stream=True, timeout=60)
+            response.raise_for_status.assert_called_once()
+            with open(filename, "rb") as f:
+                self.assertEqual(b"some data", f.read())
+        finally:
+            if os.path.isfile(filename):
+                os.remove(filename)
+
+
+class TestGetMany(unittest.TestCase):
+
+    @mock.patch("redback.get_data.get_open_transient_catalog_data")
+    def test_get_many(self, get_open_transient_catalog_data):
+        get_open_transient_catalog_data.side_effect = lambda transient, transient_type: transient.upper()
+        data = redback.get_data.get_many(["at2017gfo", "sn2011kl"], transient_type="kilonova", max_workers=2)
+        self.assertListEqual(["AT2017GFO", "SN2011KL"], data)
+        get_open_transient_catalog_data.assert_any_call("at2017gfo", transient_type="kilonova")
+        get_open_transient_catalog_data.assert_any_call("sn2011kl", transient_type="kilonova")
+
 
 class TestDirectory(unittest.TestCase):
 
@@ -217,10 +248,10 @@ class TestBATSEDataGetter(unittest.TestCase):
                    f"08121_burst/tte_bfits_8121.fits.gz"
         self.assertEqual(expected, self.getter.url)
 
-    @mock.patch("urllib.request.urlretrieve")
-    def collect_data(self, urlretrieve):
+    @mock.patch("redback.get_data.batse.download_file")
+    def collect_data(self, download_file):
         self.getter.collect_data()
-        urlretrieve.assert_called_once()
+        download_file.assert_called_once()
 
     @mock.patch("astropy.io.fits.open")
     @mock.patch("pandas.DataFrame")
@@ -269,7 +300,7 @@ class TestOpenDataGetter(unittest.TestCase):
         self.assertEqual(expected, self.getter.metadata_path)
 
     @mock.patch("os.path.isfile")
-    @mock.patch("requests.get")
+    @mock.patch("redback.get_data.utils.session.get")
     def test_collect_data_file_exists(self, get, isfile):
         isfile.return_value = True
         self.getter.collect_data()
@@ -277,24 +308,24 @@ class TestOpenDataGetter(unittest.TestCase):
         get.assert_not_called()
 
     @mock.patch("os.path.isfile")
-    @mock.patch("requests.get")
-    @mock.patch("urllib.request.urlretrieve")
-    def test_collect_data_not_found(self, urlretrieve, get, isfile):
+    @mock.patch("redback.get_data.utils.session.get")
+    @mock.patch("redback.get_data.utils.download_file")
+    def test_collect_data_not_found(self, download_file, get, isfile):
         isfile.return_value = False
         type(get.return_value).text = PropertyMock(return_value='not found')
         with self.assertRaises(ValueError):
             self.getter.collect_data()
-        get.assert_called_once_with(self.getter.url)
-        urlretrieve.assert_not_called()
+        get.assert_called_once_with(self.getter.url, timeout=30)
+        download_file.assert_not_called()
 
     @mock.patch("os.path.isfile")
-    @mock.patch("requests.get")
-    @mock.patch("urllib.request.urlretrieve")
-    def test_collect_data(self, urlretrieve, get, isfile):
+    @mock.patch("redback.get_data.utils.session.get")
+    @mock.patch("redback.get_data.utils.download_file")
+    def test_collect_data(self, download_file, get, isfile):
         isfile.return_value = False
         type(get.return_value).text = PropertyMock(return_value='')
         self.getter.collect_data()
-        urlretrieve.assert_called_with(url=self.getter.metadata_url, filename=self.getter.metadata_path)
+        download_file.assert_called_with(url=self.getter.metadata_url, filename=self.getter.metadata_path)
 
     @mock.patch("pandas.read_csv")
     @mock.patch("pandas.isna")
@@ -476,13 +507,14 @@ class TestSwiftDataGetter(unittest.TestCase):
         redback.utils.logger.warning.assert_called_once()
 
     @mock.patch("os.path.isfile")
-    @mock.patch('requests.get')
+    @mock.patch("redback.get_data.utils.session.get")
     def test_collect_data_no_lightcurve_available(self, get, isfile):
         isfile.return_value = False
         get.return_value = MagicMock()
         get.return_value.__setattr__('text', 'No Light curve available')
         with self.assertRaises(redback.redback_errors.WebsiteExist):
             self.getter.collect_data()
+        get.assert_called_once_with(self.getter.grb_website, timeout=30)
 
     @mock.patch("os.path.isfile")
     def test_collect_data_xrt(self, isfile):
@@ -536,6 +568,41 @@ class TestSwiftDataGetter(unittest.TestCase):
         self.getter.download_integrated_flux_data.assert_not_called()
         self.getter.download_flux_density_data.assert_called_once()
 
+    @mock.patch("redback.get_data.utils.download_file")
+    @mock.patch("redback.get_data.swift.fetch_shared_driver")
+    def test_download_flux_density_data_waits_for_redirected_page(self, fetch_shared_driver, download_file):
+        driver = fetch_shared_driver.return_value
+        driver.find_element.return_value.is_displayed.return_value = True
+        driver.find_element.return_value.is_enabled.return_value = True
+        redirected_url = "https://www.swift.ac.uk/burst_analyser/00000000/"
+        download_url = "https://www.swift.ac.uk/burst_analyser/00000000/xrtflux_DENSITY.qdp"
+        type(driver).current_url = PropertyMock(side_effect=[redirected_url, redirected_url, download_url,
+                                                             download_url])
+        self.getter.download_flux_density_data()
+        download_file.assert_called_once_with(url=download_url, filename=self.getter.raw_file_path)
+        driver.delete_all_cookies.assert_called_once()
+
+    @mock.patch("redback.get_data.swift.reset_shared_driver")
+    @mock.patch("redback.get_data.swift.fetch_shared_driver")
+    def test_download_flux_density_data_resets_driver_on_webdriver_exception(self, fetch_shared_driver,
+                                                                             reset_shared_driver):
+        driver = fetch_shared_driver.return_value
+        driver.get.side_effect = WebDriverException("driver died")
+        self.getter.download_flux_density_data()
+        reset_shared_driver.assert_called_once()
+        driver.delete_all_cookies.assert_not_called()
+
+    @mock.patch("redback.get_data.utils.download_file")
+    @mock.patch("redback.get_data.swift.reset_shared_driver")
+    @mock.patch("redback.get_data.swift.fetch_shared_driver")
+    def test_download_integrated_flux_data_cookie_failure_resets_driver(self, fetch_shared_driver,
+                                                                        reset_shared_driver, download_file):
+        driver = fetch_shared_driver.return_value
+        driver.get.side_effect = ValueError("page failed")
+        driver.delete_all_cookies.side_effect = WebDriverException("driver died")
+        self.getter.download_integrated_flux_data()
+        reset_shared_driver.assert_called_once()
+
     def _mock_converter_functions(self):
         self.getter.convert_xrt_data_to_csv = MagicMock()
         self.getter.convert_raw_afterglow_data_to_csv = MagicMock()
@@ -578,6 +645,55 @@ class TestSwiftDataGetter(unittest.TestCase):
         self.getter.convert_raw_afterglow_data_to_csv.assert_not_called()
         self.getter.convert_raw_prompt_data_to_csv.assert_called_once()
 
+    def _convert_reference_file(self, raw_file, processed_file, converter):
+        reference_directory = f"{os.path.dirname(__file__)}/reference_data/GRBData"
+        self.getter.raw_file_path = f"{reference_directory}/{raw_file}"
+        self.getter.processed_file_path = "GRB070809_test_processed.csv"
+        try:
+            converter()
+            with open(f"{reference_directory}/{processed_file}") as rf, open(self.getter.processed_file_path) as df:
+                self.assertEqual(rf.read(), df.read())
+        finally:
+            os.remove(self.getter.processed_file_path)
+
+    def test_convert_integrated_flux_data_to_csv(self):
+        self._convert_reference_file(
+            "afterglow/flux/GRB070809_rawSwiftData.csv", "afterglow/flux/GRB070809.csv",
+            self.getter.convert_integrated_flux_data_to_csv)
+
+    def test_convert_flux_density_data_to_csv(self):
+        self._convert_reference_file(
+            "afterglow/flux_density/GRB070809_rawSwiftData.csv", "afterglow/flux_density/GRB070809.csv",
+            self.getter.convert_flux_density_data_to_csv)
+
+    def test_convert_flux_density_data_to_csv_extra_fields(self):
+        reference_directory = f"{os.path.dirname(__file__)}/reference_data/GRBData/afterglow/flux_density"
+        with open(f"{reference_directory}/GRB070809_rawSwiftData.csv") as f:
+            lines = f.read().split('\n')
+        # a trailing tab on a row after the first data row must not break the parser
+        lines[-2] += '\t'
+        self.getter.raw_file_path = "GRB070809_test_rawSwiftData.csv"
+        self.getter.processed_file_path = "GRB070809_test_processed.csv"
+        with open(self.getter.raw_file_path, "w") as f:
+            f.write('\n'.join(lines))
+        try:
+            self.getter.convert_flux_density_data_to_csv()
+            with open(f"{reference_directory}/GRB070809.csv") as rf, open(self.getter.processed_file_path) as df:
+                self.assertEqual(rf.read(), df.read())
+        finally:
+            os.remove(self.getter.raw_file_path)
+            os.remove(self.getter.processed_file_path)
+
+    def test_convert_xrt_data_to_csv(self):
+        self._convert_reference_file(
+            "afterglow/flux/GRB070809_xrt_rawSwiftData.csv", "afterglow/flux/GRB070809_xrt.csv",
+            self.getter.convert_xrt_data_to_csv)
+
+    def test_convert_raw_prompt_data_to_csv(self):
+        self._convert_reference_file(
+            "prompt/flux/GRB070809_1s_lc_ascii.dat", "prompt/flux/GRB070809_1s_lc.csv",
+            self.getter.convert_raw_prompt_data_to_csv)
+
 
 class TestLasairDataGetter(unittest.TestCase):
 
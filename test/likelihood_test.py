@@ -67,10 +67,41 @@ class GaussianLikelihoodTest(unittest.TestCase):
         expected = np.sum(- (self.y / self.sigma) ** 2 / 2 - np.log(2 * np.pi * self.sigma ** 2) / 2)
         self.assertEqual(expected, self.likelihood.noise_log_likelihood())
 
+    def test_log_normalisation_array_sigma(self):
+        sigma = np.array([1., 2., 3.])
+        self.likelihood.sigma = sigma
+        expected = np.sum(-np.log(2 * np.pi * sigma ** 2) / 2)
+        self.assertAlmostEqual(expected, self.likelihood.log_normalisation)
+
+    def test_log_normalisation_reset_on_sigma_change(self):
+        _ = self.likelihood.log_normalisation
+        self.likelihood.sigma = 2
+        expected = -3 * np.log(2 * np.pi * 2 ** 2) / 2
+        self.assertAlmostEqual(expected, self.likelihood.log_normalisation)
+
     def test_residual(self):
         expected = self.x - self.y
         self.assertTrue(np.array_equal(expected, self.likelihood.residual))
 
+    def test_buffered_residual_reuses_buffer(self):
+        self.likelihood.y = np.array([1., 2., 3.])
+        first = self.likelihood._buffered_residual()
+        second = self.likelihood._buffered_residual()
+        self.assertIs(first, second)
+        self.assertTrue(np.array_equal(self.likelihood.residual, second))
+
+    def test_log_l_value_buffered(self):
+        self.likelihood.y = np.array([1., 2., 4.])
+        expected = np.sum(- (self.likelihood.residual / self.sigma) ** 2 / 2
+                          - np.log(2 * np.pi * self.sigma ** 2) / 2)
+        self.assertAlmostEqual(expected, self.likelihood.log_likelihood())
+        self.assertAlmostEqual(expected, self.likelihood.log_likelihood())
+
+    def test_noise_log_l_value_fused(self):
+        expected = np.sum(- (self.y / self.sigma) ** 2 / 2 - np.log(2 * np.pi * self.sigma ** 2) / 2)
+        with mock.patch("redback.likelihoods._NUMEXPR_MIN_SIZE", 0):
+            self.assertAlmostEqual(expected, self.likelihood.noise_log_likelihood())
+
 
 class GaussianLikelihoodUniformXErrorsTest(unittest.TestCase):
 
@@ -312,3 +343,9 @@ class PoissonLikelihoodTest(unittest.TestCase):
         expected = -6 + np.log(9)
         actual = self.likelihood.log_likelihood()
         self.assertEqual(expected, actual)
+
+    def test_log_likelihood_value_fused(self):
+        expected = -6 + np.log(9)
+        with mock.patch("redback.likelihoods._NUMEXPR_MIN_SIZE", 0):
+            actual = self.likelihood.log_likelihood()
+        self.assertAlmostEqual(expected, actual)
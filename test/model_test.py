@@ -398,3 +398,104 @@ class TestThinShellExpansion(unittest.TestCase):
         ys = function(self.time, **prior.sample(), **kwargs)
         self.assertEqual(len(self.time), len(ys))
 
+
+
+class TestExtinctionBaseModel(unittest.TestCase):
+
+    def test_function_base_model(self):
+        def base_model(time, **kwargs):
+            return time
+        function = redback.transient_models.extinction_models._get_correct_function(base_model=base_model)
+        self.assertIs(base_model, function)
+
+    def test_named_base_model(self):
+        function = redback.transient_models.extinction_models._get_correct_function(
+            base_model='tophat', model_type='afterglow')
+        self.assertIs(redback.transient_models.afterglow_models.tophat, function)
+
+    def test_unknown_base_model(self):
+        with self.assertRaises(ValueError):
+            redback.transient_models.extinction_models._get_correct_function(
+                base_model='not_a_model', model_type='afterglow')
+
+    def test_base_model_output_reused(self):
+        base_model = mock.MagicMock(side_effect=lambda time, **kwargs: time * kwargs['amplitude'])
+        time = np.array([1., 2., 3.])
+        first = redback.transient_models.extinction_models._cached_base_model_call(
+            base_model, time, use_cache=True, amplitude=2., frequency=np.array([1e14, 1e14, 1e14]))
+        first *= 0
+        second = redback.transient_models.extinction_models._cached_base_model_call(
+            base_model, time, use_cache=True, amplitude=2., frequency=np.array([1e14, 1e14, 1e14]))
+        self.assertEqual(1, base_model.call_count)
+        self.assertTrue(np.array_equal(time * 2., second))
+        self.assertFalse(second.flags.writeable)
+
+    def test_base_model_output_not_reused_for_new_arguments(self):
+        base_model = mock.MagicMock(side_effect=lambda time, **kwargs: time * kwargs['amplitude'])
+        time = np.array([1., 2., 3.])
+        redback.transient_models.extinction_models._cached_base_model_call(
+            base_model, time, use_cache=True, amplitude=2.)
+        redback.transient_models.extinction_models._cached_base_model_call(
+            base_model, time, use_cache=True, amplitude=3.)
+        redback.transient_models.extinction_models._cached_base_model_call(
+            base_model, time, use_cache=True, amplitude=[2.])
+        self.assertEqual(3, base_model.call_count)
+
+    def test_scalar_frequency_extinction(self):
+        def base_model(time, **kwargs):
+            return np.ones(len(time))
+        time = np.array([1., 2., 3.])
+        for frequency in [5e14, 500000000000000, np.float32(5e14)]:
+            flux_density = redback.transient_models.extinction_models.extinction_with_function(
+                time, av=0.5, base_model=base_model, frequency=frequency, output_format='flux_density')
+            self.assertEqual(time.shape, flux_density.shape)
+            self.assertTrue(np.all(flux_density < 1))
+
+    def test_base_model_cache_opt_in(self):
+        calls = []
+
+        def base_model(time, **kwargs):
+            calls.append(kwargs)
+            return np.ones(len(time))
+        time = np.array([1., 2., 3.])
+        for _ in range(2):
+            redback.transient_models.extinction_models.extinction_with_function(
+                time, av=0.5, base_model=base_model, frequency=5e14, output_format='flux_density')
+        self.assertEqual(2, len(calls))
+        outputs = [redback.transient_models.extinction_models.extinction_with_function(
+            time, av=0.5, base_model=base_model, frequency=5e14, output_format='flux_density', r_v=3.1,
+            _cache=True) for _ in range(2)]
+        self.assertEqual(3, len(calls))
+        self.assertNotIn('_cache', calls[-1])
+        self.assertNotIn('r_v', calls[-1])
+        self.assertTrue(np.array_equal(outputs[0], outputs[1]))
+
+    def test_library_base_model_output_attenuated_in_place(self):
+        outputs = []
+
+        def base_model(time, **kwargs):
+            outputs.append(np.ones(len(time)))
+            return outputs[-1]
+        time = np.array([1., 2., 3.])
+        with mock.patch('redback.transient_models.extinction_models._get_correct_function', return_value=base_model):
+            flux_density = redback.transient_models.extinction_models.extinction_with_afterglow_base_model(
+                time, av=0.5, base_model='tophat', frequency=5e14, output_format='flux_density')
+            self.assertIs(outputs[-1], flux_density)
+            cached = [redback.transient_models.extinction_models.extinction_with_afterglow_base_model(
+                time, av=0.5, base_model='tophat', frequency=5e14, output_format='flux_density', _cache=True)
+                for _ in range(3)]
+        self.assertEqual(2, len(outputs))
+        self.assertTrue(np.allclose(flux_density, cached[0]))
+        self.assertTrue(np.allclose(cached[1], cached[2]))
+
+    def test_reused_base_model_output_not_modified(self):
+        template = np.ones(3)
+
+        def base_model(time, **kwargs):
+            return template
+        time = np.array([1., 2., 3.])
+        outputs = [redback.transient_models.extinction_models.extinction_with_function(
+            time, av=0.5, base_model=base_model, frequency=5e14, output_format='flux_density', cosmology=object())
+            for _ in range(3)]
+        self.assertTrue(np.array_equal(np.ones(3), template))
+        self.assertTrue(np.array_equal(outputs[0], outputs[2]))
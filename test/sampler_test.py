@@ -22,3 +22,17 @@ class TestFitModel(unittest.TestCase):
 
     def tearDown(self) -> None:
         pass
+
+
+class TestLoadPrior(unittest.TestCase):
+
+    def test_prior_is_cached(self):
+        self.assertIs(sampler._load_prior("tophat"), sampler._load_prior("tophat"))
+
+    def test_copy_does_not_modify_cache(self):
+        maximum = sampler._load_prior("tophat")["redshift"].maximum
+        prior = sampler._get_default_prior("tophat")
+        prior["test_key"] = 1
+        prior["redshift"].maximum = -999
+        self.assertNotIn("test_key", sampler._load_prior("tophat"))
+        self.assertEqual(maximum, sampler._load_prior("tophat")["redshift"].maximum)
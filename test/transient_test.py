@@ -620,6 +620,27 @@ class TestAfterglow(unittest.TestCase):
     def test_analytical_flux_to_luminosity(self):
         pass
 
+    def test_load_data_reads_file_once(self):
+        processed_file_path = "test_load_data_reads_file_once.csv"
+        with open(processed_file_path, "w") as f:
+            f.write("time,time_err_pos,time_err_neg,flux,flux_err_pos,flux_err_neg\n"
+                    "1,0.1,0.1,3,0.3,-0.3\n2,0.2,0.2,4,0.4,-0.4\n")
+        directory_structure = MagicMock(processed_file_path=processed_file_path)
+        try:
+            with mock.patch("redback.transient.afterglow.afterglow_directory_structure",
+                            return_value=directory_structure), \
+                    mock.patch("numpy.genfromtxt", wraps=np.genfromtxt) as genfromtxt:
+                x, x_err, y, y_err = redback.transient.afterglow.Afterglow.load_data(name=self.name, data_mode="flux")
+                x[0] = 100
+                x, x_err, y, y_err = redback.transient.afterglow.Afterglow.load_data(name=self.name, data_mode="flux")
+                self.assertEqual(1, genfromtxt.call_count)
+            self.assertTrue(np.array_equal(np.array([1., 2.]), x))
+            self.assertTrue(np.array_equal(np.array([[0.1, 0.2], [0.1, 0.2]]), x_err))
+            self.assertTrue(np.array_equal(np.array([3., 4.]), y))
+            self.assertTrue(np.array_equal(np.array([[0.3, 0.4], [0.3, 0.4]]), y_err))
+        finally:
+            os.remove(processed_file_path)
+
 
 class TestTrunctator(unittest.TestCase):
 
@@ -1,4 +1,7 @@
 import unittest
+from unittest import mock
+
+import numpy as np
 
 import redback
 
@@ -48,3 +51,38 @@ class TestTimeConversion(unittest.TestCase):
     def test_date_to_mjd(self):
         mjd = redback.utils.date_to_mjd(year=self.year, month=self.month, day=self.day)
         self.assertEqual(self.mjd, mjd)
+
+
+class TestSharedDriver(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        redback.utils._shared_driver = None
+        redback.utils._shared_driver_quit_registered = False
+
+    @mock.patch("atexit.register")
+    @mock.patch("redback.utils.fetch_driver")
+    def test_driver_is_reused(self, fetch_driver, register):
+        driver = redback.utils.fetch_shared_driver()
+        self.assertIs(driver, redback.utils.fetch_shared_driver())
+        fetch_driver.assert_called_once()
+        register.assert_called_once()
+
+    @mock.patch("atexit.register")
+    @mock.patch("redback.utils.fetch_driver")
+    def test_reset_starts_fresh_driver(self, fetch_driver, register):
+        old_driver, new_driver = mock.MagicMock(), mock.MagicMock()
+        fetch_driver.side_effect = [old_driver, new_driver]
+        self.assertIs(old_driver, redback.utils.fetch_shared_driver())
+        old_driver.quit.side_effect = Exception("driver died")
+        redback.utils.reset_shared_driver()
+        old_driver.quit.assert_called_once()
+        self.assertIs(new_driver, redback.utils.fetch_shared_driver())
+
+
+class TestMagnitudeConversion(unittest.TestCase):
+
+    def test_ABmag_from_flux_density_value(self):
+        flux_density = np.logspace(-5, 3, 20)
+        expected = redback.utils.calc_ABmag_from_flux_density(flux_density).value
+        self.assertTrue(np.allclose(expected, redback.utils.calc_ABmag_from_flux_density_value(flux_density),
+                                    rtol=0, atol=1e-12))